@@ -10,17 +10,26 @@ License: MIT
 """
 
 import argparse
+import asyncio
+import csv
 import os
 import platform
-import re
+import queue
+import select
 import socket
+import struct
 import subprocess
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 
+# Computed once: platform.system() is not free and the answer never changes
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_MACOS = platform.system() == "Darwin"
+
 # Configuration
 VERSION = "1.0.0"
 DEFAULT_COUNT = 4
@@ -43,7 +52,7 @@ class Colors:
 
 
 # Disable colors on Windows without ANSI support
-if platform.system() == "Windows":
+if _IS_WINDOWS:
     try:
         import ctypes
         kernel32 = ctypes.windll.kernel32
@@ -52,7 +61,7 @@ if platform.system() == "Windows":
         Colors.disable()
 
 
-@dataclass
+@dataclass(slots=True)
 class PingResult:
     """Represents the result of a ping operation."""
     host: str
@@ -93,49 +102,214 @@ def resolve_hostname(host: str) -> Optional[str]:
         return None
 
 
+# Hostname -> IPv4 address (or None if resolution failed), shared across runs
+_DNS_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _resolve_all(hosts: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Resolve every unique host to an IPv4 address in one concurrent pass.
+
+    Resolutions are memoized in _DNS_CACHE so aliases and repeated hosts
+    hit the resolver at most once; the ping paths then operate purely on
+    IPs. Unresolvable hosts map to None.
+    """
+    unresolved = [h for h in dict.fromkeys(hosts) if h not in _DNS_CACHE]
+
+    if unresolved:
+        def _lookup(host: str) -> Optional[str]:
+            try:
+                info = socket.getaddrinfo(host, None, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+                return info[0][4][0]
+            except (socket.gaierror, UnicodeError):
+                # UnicodeError: IDNA rejects overlong/empty hostname labels
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(unresolved))) as executor:
+            for host, ip in zip(unresolved, executor.map(_lookup, unresolved)):
+                _DNS_CACHE[host] = ip
+
+    return {h: _DNS_CACHE[h] for h in hosts}
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Compute the 16-bit one's-complement checksum used by ICMP."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = 0
+    for i in range(0, len(data), 2):
+        total += (data[i] << 8) | data[i + 1]
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _icmp_socket() -> socket.socket:
+    """Open an ICMP socket, preferring the unprivileged datagram flavor."""
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+
+
+def _icmp_ping(host: str, count: int, timeout: int, result: PingResult) -> PingResult:
+    """
+    Ping a host with in-process ICMP Echo packets (no subprocess).
+
+    Raises PermissionError if the platform refuses both the datagram and
+    raw ICMP socket, in which case the caller falls back to the ping binary.
+    """
+    ip = socket.gethostbyname(host)
+    sock = _icmp_socket()
+    # Raw sockets deliver replies with the IP header attached; datagram
+    # sockets strip it on Linux but keep it on macOS
+    is_raw = sock.type == socket.SOCK_RAW
+    has_ip_header = is_raw or _IS_MACOS
+    ident = os.getpid() & 0xFFFF
+    latencies = []
+
+    try:
+        for seq in range(count):
+            header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+            payload = struct.pack("!d", time.perf_counter())
+            checksum = _icmp_checksum(header + payload)
+            packet = struct.pack("!BBHHH", 8, 0, checksum, ident, seq) + payload
+
+            sent_at = time.perf_counter()
+            sock.sendto(packet, (ip, 0))
+            result.packets_sent += 1
+
+            deadline = sent_at + timeout
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                readable, _, _ = select.select([sock], [], [], remaining)
+                if not readable:
+                    break
+                data, addr = sock.recvfrom(1024)
+                elapsed = (time.perf_counter() - sent_at) * 1000
+                offset = (data[0] & 0x0F) * 4 if has_ip_header else 0
+                reply_type, _, _, reply_ident, reply_seq = struct.unpack_from("!BBHHH", data, offset)
+                # Echo Reply from the pinged host matching this probe. The
+                # source check matters on raw sockets, which receive all
+                # inbound ICMP: concurrent pings share (ident, seq) spaces,
+                # so without it a reply from host A satisfies host B's probe.
+                # (The kernel rewrites the identifier on datagram sockets,
+                # so only check it on raw ones.)
+                if (reply_type == 0 and reply_seq == seq and addr[0] == ip
+                        and (not is_raw or reply_ident == ident)):
+                    result.packets_received += 1
+                    latencies.append(elapsed)
+                    break
+    finally:
+        sock.close()
+
+    if result.packets_sent > 0:
+        result.packet_loss = ((result.packets_sent - result.packets_received) / result.packets_sent) * 100
+    if latencies:
+        result.min_latency = min(latencies)
+        result.avg_latency = sum(latencies) / len(latencies)
+        result.max_latency = max(latencies)
+    result.is_reachable = result.packets_received > 0
+
+    return result
+
+
+def _tcp_ping(host: str, port: int, timeout: int, result: PingResult) -> PingResult:
+    """
+    Reachability probe via a single TCP connect: one RTT, no raw-socket
+    privileges, no subprocess. Latency is the connect time.
+    """
+    result.packets_sent = 1
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            elapsed = (time.perf_counter() - start) * 1000
+    except OSError as e:
+        result.packet_loss = 100.0
+        result.error = str(e)
+        return result
+
+    result.packets_received = 1
+    result.min_latency = result.avg_latency = result.max_latency = elapsed
+    result.is_reachable = True
+    return result
+
+
 def ping_host(
     host: str,
     count: int = DEFAULT_COUNT,
-    timeout: int = DEFAULT_TIMEOUT
+    timeout: int = DEFAULT_TIMEOUT,
+    addr: Optional[str] = None,
+    port: Optional[int] = None
 ) -> PingResult:
     """
     Ping a host and return detailed results.
-    
+
     Args:
         host: Hostname or IP address to ping
         count: Number of ping packets to send
         timeout: Timeout in seconds
-    
+        addr: Pre-resolved IP address (skips a DNS lookup when provided)
+        port: Probe with a TCP connect to this port instead of ICMP
+
     Returns:
         PingResult object with ping statistics
     """
-    result = PingResult(host=host, is_reachable=False, timestamp=time.time())
-    
+    # perf_counter: monotonic, vDSO-fast, immune to NTP jumps mid-run
+    result = PingResult(host=host, is_reachable=False, timestamp=time.perf_counter())
+    target = addr or host
+
+    if port is not None:
+        return _tcp_ping(target, port, timeout, result)
+
+    # Prefer the in-process ICMP path; it avoids a fork+exec per host
+    try:
+        return _icmp_ping(target, count, timeout, result)
+    except PermissionError:
+        pass  # ICMP sockets unavailable; fall back to the ping binary
+    except (socket.gaierror, UnicodeError):
+        # gaierror: no IPv4 address; UnicodeError: IDNA-invalid label.
+        # Either way the ping binary gets a chance to resolve it
+        pass
+    except OSError as e:
+        result.error = str(e)
+        return result
+
     # Determine ping command based on OS
-    system = platform.system().lower()
-    
-    if system == "windows":
-        cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), host]
+    if _IS_WINDOWS:
+        cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), target]
     else:  # Linux, macOS
-        cmd = ["ping", "-c", str(count), "-W", str(timeout), host]
+        cmd = ["ping", "-c", str(count), "-W", str(timeout), target]
     
     try:
-        output = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout * count + 5
-        )
-        
-        stdout = output.stdout
-        
-        # Parse results based on OS
-        if system == "windows":
-            result = _parse_windows_ping(host, stdout, result)
+        # No text=True: the parsers match raw bytes, so the output is never decoded.
+        # Keep this call posix_spawn-eligible (no preexec_fn, no shell=True, no
+        # custom fd handling): subprocess then spawns via vfork on Linux, O(1)
+        # per process instead of an O(RSS) fork of the interpreter.
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            stdout, _ = proc.communicate(timeout=timeout * count + 5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+
+        # Parse results based on OS, applying the parsed fields in one place
+        if _IS_WINDOWS:
+            sent, received, mn, avg, mx = _parse_windows_ping(stdout)
         else:
-            result = _parse_unix_ping(host, stdout, result)
-        
-        result.is_reachable = result.packets_received > 0
+            sent, received, mn, avg, mx = _parse_unix_ping(stdout)
+
+        result.packets_sent = sent
+        result.packets_received = received
+        if sent > 0:
+            result.packet_loss = ((sent - received) / sent) * 100
+        result.min_latency = mn
+        result.avg_latency = avg
+        result.max_latency = mx
+        result.is_reachable = received > 0
         
     except subprocess.TimeoutExpired:
         result.error = "Ping timed out"
@@ -147,79 +321,225 @@ def ping_host(
     return result
 
 
-def _parse_unix_ping(host: str, output: str, result: PingResult) -> PingResult:
-    """Parse Unix/Linux/macOS ping output."""
-    # Parse packet statistics
-    # Example: "4 packets transmitted, 4 received, 0% packet loss"
-    stats_match = re.search(
-        r"(\d+)\s+packets?\s+transmitted,\s+(\d+)\s+(?:packets?\s+)?received",
-        output
-    )
-    if stats_match:
-        result.packets_sent = int(stats_match.group(1))
-        result.packets_received = int(stats_match.group(2))
-        if result.packets_sent > 0:
-            result.packet_loss = ((result.packets_sent - result.packets_received) / result.packets_sent) * 100
-    
-    # Parse latency statistics
-    # Example: "rtt min/avg/max/mdev = 10.123/15.456/20.789/3.456 ms"
-    latency_match = re.search(
-        r"(?:rtt|round-trip)\s+min/avg/max(?:/\w+)?\s*=\s*([\d.]+)/([\d.]+)/([\d.]+)",
-        output
-    )
-    if latency_match:
-        result.min_latency = float(latency_match.group(1))
-        result.avg_latency = float(latency_match.group(2))
-        result.max_latency = float(latency_match.group(3))
-    
-    return result
+def _parse_unix_ping(output: bytes) -> Tuple[int, int, Optional[float], Optional[float], Optional[float]]:
+    """
+    Parse Unix/Linux/macOS ping output with plain string scanning.
 
+    Returns (sent, received, min, avg, max); the caller applies the tuple
+    to the PingResult in one place.
+    """
+    sent = received = 0
+    mn = avg = mx = None
+
+    # The stats block always sits in the last few lines; drop the per-packet
+    # noise above it so the scan covers O(1) bytes regardless of count
+    pieces = output.rsplit(b"\n", 6)
+    if len(pieces) > 6:
+        output = b"\n".join(pieces[1:])
+
+    # Cheap C-level substring check; skips the line scan entirely for
+    # error output from unreachable hosts
+    if b"transmitted" not in output and b"min/avg/max" not in output:
+        return sent, received, mn, avg, mx
+
+    for line in output.splitlines():
+        if b"transmitted" in line:
+            # "4 packets transmitted, 4 received, 0% packet loss" (Linux)
+            # "4 packets transmitted, 4 packets received, 0.0% ..." (macOS)
+            parts = line.split()
+            try:
+                sent = int(parts[0])
+                received = int(parts[3])
+            except (IndexError, ValueError):
+                continue
+        elif b"min/avg/max" in line:
+            # "rtt min/avg/max/mdev = 10.123/15.456/20.789/3.456 ms"
+            try:
+                mn, avg, mx = (float(v) for v in line.split(b"=", 1)[1].split(b"/")[:3])
+            except ValueError:
+                continue
+
+    return sent, received, mn, avg, mx
+
+
+def _parse_windows_ping(output: bytes) -> Tuple[int, int, Optional[float], Optional[float], Optional[float]]:
+    """
+    Parse Windows ping output with plain string scanning.
 
-def _parse_windows_ping(host: str, output: str, result: PingResult) -> PingResult:
-    """Parse Windows ping output."""
-    # Parse packet statistics
-    # Example: "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss)"
-    stats_match = re.search(
-        r"Sent\s*=\s*(\d+),\s*Received\s*=\s*(\d+)",
-        output
-    )
-    if stats_match:
-        result.packets_sent = int(stats_match.group(1))
-        result.packets_received = int(stats_match.group(2))
-        if result.packets_sent > 0:
-            result.packet_loss = ((result.packets_sent - result.packets_received) / result.packets_sent) * 100
-    
-    # Parse latency statistics
-    # Example: "Minimum = 10ms, Maximum = 20ms, Average = 15ms"
-    latency_match = re.search(
-        r"Minimum\s*=\s*(\d+)ms,\s*Maximum\s*=\s*(\d+)ms,\s*Average\s*=\s*(\d+)ms",
-        output
-    )
-    if latency_match:
-        result.min_latency = float(latency_match.group(1))
-        result.max_latency = float(latency_match.group(2))
-        result.avg_latency = float(latency_match.group(3))
-    
-    return result
+    Returns (sent, received, min, avg, max); the caller applies the tuple
+    to the PingResult in one place.
+    """
+    sent = received = 0
+    mn = avg = mx = None
+
+    # The stats block always sits in the last few lines; drop the per-packet
+    # noise above it so the scan covers O(1) bytes regardless of count
+    pieces = output.rsplit(b"\n", 6)
+    if len(pieces) > 6:
+        output = b"\n".join(pieces[1:])
+
+    # Cheap C-level substring check; skips the line scan entirely for
+    # error output from unreachable hosts
+    if b"Sent" not in output and b"Minimum" not in output:
+        return sent, received, mn, avg, mx
+
+    for line in output.splitlines():
+        if b"Sent" in line and b"Received" in line:
+            # "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss),"
+            parts = line.replace(b",", b" ").split()
+            try:
+                sent = int(parts[parts.index(b"Sent") + 2])
+                received = int(parts[parts.index(b"Received") + 2])
+            except (IndexError, ValueError):
+                continue
+        elif b"Minimum" in line:
+            # "Minimum = 10ms, Maximum = 20ms, Average = 15ms"
+            parts = line.replace(b"ms", b"").replace(b",", b" ").split()
+            try:
+                mn = float(parts[parts.index(b"Minimum") + 2])
+                mx = float(parts[parts.index(b"Maximum") + 2])
+                avg = float(parts[parts.index(b"Average") + 2])
+            except (IndexError, ValueError):
+                mn = avg = mx = None
+                continue
+
+    return sent, received, mn, avg, mx
 
 
 def print_result(result: PingResult, verbose: bool = False):
-    """Print ping result with colors."""
+    """Print ping result with colors (one stdout write per result)."""
     if result.is_reachable:
         status = f"{Colors.GREEN}✓ REACHABLE{Colors.RESET}"
         latency_str = ""
         if result.avg_latency is not None:
             latency_str = f" (avg: {result.avg_latency:.1f}ms)"
-        print(f"{status} {result.host}{latency_str}")
-        
+        buf = f"{status} {result.host}{latency_str}\n"
+
         if verbose and result.min_latency is not None:
-            print(f"  └─ Packets: {result.packets_received}/{result.packets_sent} "
-                  f"| Loss: {result.packet_loss:.1f}% "
-                  f"| Latency: {result.min_latency:.1f}/{result.avg_latency:.1f}/{result.max_latency:.1f} ms")
+            buf += (f"  └─ Packets: {result.packets_received}/{result.packets_sent} "
+                    f"| Loss: {result.packet_loss:.1f}% "
+                    f"| Latency: {result.min_latency:.1f}/{result.avg_latency:.1f}/{result.max_latency:.1f} ms\n")
     else:
         status = f"{Colors.RED}✗ UNREACHABLE{Colors.RESET}"
         error_str = f" ({result.error})" if result.error else ""
-        print(f"{status} {result.host}{error_str}")
+        buf = f"{status} {result.host}{error_str}\n"
+
+    sys.stdout.write(buf)
+
+
+def _print_worker(results_queue: queue.SimpleQueue, verbose: bool):
+    """Drain results to stdout until the None sentinel arrives."""
+    while True:
+        result = results_queue.get()
+        if result is None:
+            break
+        print_result(result, verbose)
+
+
+async def ping_all(
+    hosts: List[str],
+    count: int = DEFAULT_COUNT,
+    timeout: int = DEFAULT_TIMEOUT,
+    addrs: Optional[Dict[str, Optional[str]]] = None
+) -> List[PingResult]:
+    """
+    Probe all hosts over a single non-blocking ICMP socket.
+
+    Every Echo Request is sent up front with a sequence number unique to
+    its probe, then one event-loop reader demultiplexes the replies — no
+    thread per host, no blocking syscall per probe. `addrs` is the
+    host -> IP mapping from _resolve_all; it is computed here if omitted.
+
+    Raises PermissionError if the platform refuses ICMP sockets.
+    """
+    if addrs is None:
+        addrs = await asyncio.to_thread(_resolve_all, hosts)
+
+    loop = asyncio.get_running_loop()
+    sock = _icmp_socket()
+    sock.setblocking(False)
+    is_raw = sock.type == socket.SOCK_RAW
+    # As in _icmp_ping: raw sockets always carry the IP header, and macOS
+    # datagram sockets keep it too
+    has_ip_header = is_raw or _IS_MACOS
+    ident = os.getpid() & 0xFFFF
+
+    results = [PingResult(host=h, is_reachable=False, timestamp=time.perf_counter()) for h in hosts]
+    latencies: List[List[float]] = [[] for _ in hosts]
+    pending: Dict[int, Tuple[int, float]] = {}  # seq -> (host index, send time)
+    all_replied = loop.create_future()  # re-created per send batch below
+
+    def _on_readable():
+        while True:
+            try:
+                data, _ = sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            now = time.perf_counter()
+            offset = (data[0] & 0x0F) * 4 if has_ip_header else 0
+            try:
+                reply_type, _, _, reply_ident, reply_seq = struct.unpack_from("!BBHHH", data, offset)
+            except struct.error:
+                continue
+            if reply_type != 0 or (is_raw and reply_ident != ident):
+                continue
+            probe = pending.pop(reply_seq, None)
+            if probe is None:
+                continue
+            index, sent_at = probe
+            results[index].packets_received += 1
+            latencies[index].append((now - sent_at) * 1000)
+            if not pending and not all_replied.done():
+                all_replied.set_result(None)
+
+    loop.add_reader(sock.fileno(), _on_readable)
+    try:
+        # A 16-bit sequence number can only distinguish 65536 in-flight
+        # probes, so larger scans go out in batches that fit the sequence
+        # space; each batch is awaited (and pending cleared) before the next
+        hosts_per_batch = max(1, 0x10000 // max(1, count))
+        for base in range(0, len(hosts), hosts_per_batch):
+            all_replied = loop.create_future()
+            for index in range(base, min(base + hosts_per_batch, len(hosts))):
+                ip = addrs.get(hosts[index])
+                if ip is None:
+                    results[index].error = "Name resolution failed"
+                    continue
+                for i in range(count):
+                    seq = (index - base) * count + i
+                    header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+                    payload = struct.pack("!d", time.perf_counter())
+                    checksum = _icmp_checksum(header + payload)
+                    packet = struct.pack("!BBHHH", 8, 0, checksum, ident, seq) + payload
+                    try:
+                        pending[seq] = (index, time.perf_counter())
+                        sock.sendto(packet, (ip, 0))
+                    except OSError as e:
+                        pending.pop(seq, None)
+                        results[index].error = str(e)
+                        break
+                    results[index].packets_sent += 1
+
+            if pending:
+                try:
+                    await asyncio.wait_for(all_replied, timeout)
+                except asyncio.TimeoutError:
+                    pass
+                pending.clear()
+    finally:
+        loop.remove_reader(sock.fileno())
+        sock.close()
+
+    for result, lats in zip(results, latencies):
+        if result.packets_sent > 0:
+            result.packet_loss = ((result.packets_sent - result.packets_received) / result.packets_sent) * 100
+        if lats:
+            result.min_latency = min(lats)
+            result.avg_latency = sum(lats) / len(lats)
+            result.max_latency = max(lats)
+        result.is_reachable = result.packets_received > 0
+
+    return results
 
 
 def ping_multiple(
@@ -227,69 +547,135 @@ def ping_multiple(
     count: int = DEFAULT_COUNT,
     timeout: int = DEFAULT_TIMEOUT,
     threads: int = DEFAULT_THREADS,
-    verbose: bool = False
+    verbose: bool = False,
+    port: Optional[int] = None
 ) -> List[PingResult]:
     """
     Ping multiple hosts concurrently.
-    
+
     Args:
         hosts: List of hostnames or IP addresses
         count: Number of ping packets per host
         timeout: Timeout in seconds
-        threads: Number of concurrent threads
+        threads: Number of concurrent threads (thread-pool path only)
         verbose: Show detailed output
-    
+        port: Probe with TCP connects to this port instead of ICMP
+
     Returns:
         List of PingResult objects
     """
-    results = []
-    
     print(f"\n{Colors.CYAN}[*] Pinging {len(hosts)} host(s)...{Colors.RESET}\n")
-    
+
+    # Resolve everything once up front; the ping paths then see only IPs
+    addrs = _resolve_all(hosts)
+
+    # Preferred path: one event loop, one ICMP socket for the whole batch
+    # (TCP probes are blocking connects, so they go through the thread pool).
+    # NotImplementedError covers Windows' proactor loop, which cannot
+    # add_reader on sockets; OSError covers refused ICMP sockets.
+    if port is None:
+        try:
+            results = asyncio.run(ping_all(hosts, count, timeout, addrs))
+        except (NotImplementedError, OSError):
+            results = None
+
+        if results is not None:
+            # Hosts without an IPv4 address get a second chance through the
+            # ping binary, which may still resolve them (e.g. IPv6-only names)
+            unresolved = [i for i, h in enumerate(hosts) if addrs.get(h) is None]
+            if unresolved:
+                with ThreadPoolExecutor(max_workers=min(threads, len(unresolved))) as executor:
+                    retries = {
+                        executor.submit(ping_host, hosts[i], count, timeout): i
+                        for i in unresolved
+                    }
+                    for future in as_completed(retries):
+                        results[retries[future]] = future.result()
+
+            for result in results:
+                print_result(result, verbose)
+            return results
+
+    # Thread pool over the ping-binary (or TCP-probe) path. Preallocate the
+    # results slot-per-host so completion order never reorders the output list.
+    # A dedicated printer thread drains stdout so terminal latency never
+    # stalls the completion loop.
+    results = [None] * len(hosts)
+    out_queue = queue.SimpleQueue()
+    printer = threading.Thread(target=_print_worker, args=(out_queue, verbose), daemon=True)
+    printer.start()
+
     with ThreadPoolExecutor(max_workers=threads) as executor:
         futures = {
-            executor.submit(ping_host, host, count, timeout): host
-            for host in hosts
+            executor.submit(ping_host, host, count, timeout, addrs.get(host), port): index
+            for index, host in enumerate(hosts)
         }
-        
+
         for future in as_completed(futures):
             result = future.result()
-            results.append(result)
-            print_result(result, verbose)
-    
+            results[futures[future]] = result
+            out_queue.put(result)
+
+    out_queue.put(None)
+    printer.join()
+
     return results
 
 
 def print_summary(results: List[PingResult]):
     """Print summary of ping results."""
+    # Accumulate everything in a single pass over the results
     total = len(results)
-    reachable = sum(1 for r in results if r.is_reachable)
+    reachable = 0
+    latency_sum = 0.0
+    latency_count = 0
+    for r in results:
+        reachable += r.is_reachable
+        latency = r.avg_latency
+        if latency is not None:
+            latency_sum += latency
+            latency_count += 1
     unreachable = total - reachable
-    
-    avg_latencies = [r.avg_latency for r in results if r.avg_latency is not None]
-    overall_avg = sum(avg_latencies) / len(avg_latencies) if avg_latencies else 0
-    
+
     print(f"\n{Colors.CYAN}{'='*50}{Colors.RESET}")
     print(f"{Colors.BOLD}Summary:{Colors.RESET}")
     print(f"  Total hosts: {total}")
     print(f"  {Colors.GREEN}Reachable: {reachable}{Colors.RESET}")
     print(f"  {Colors.RED}Unreachable: {unreachable}{Colors.RESET}")
-    if avg_latencies:
-        print(f"  Average latency: {overall_avg:.1f}ms")
+    if latency_count:
+        print(f"  Average latency: {latency_sum / latency_count:.1f}ms")
     print(f"{Colors.CYAN}{'='*50}{Colors.RESET}")
 
 
+_CSV_HEADER = ("Host", "Reachable", "Packets Sent", "Packets Received",
+               "Loss %", "Min Latency", "Avg Latency", "Max Latency")
+
+
 def save_results(results: List[PingResult], output_path: str):
-    """Save results to file."""
-    with open(output_path, "w") as f:
-        f.write("Host,Reachable,Packets Sent,Packets Received,Loss %,Min Latency,Avg Latency,Max Latency\n")
-        for r in results:
-            f.write(f"{r.host},{r.is_reachable},{r.packets_sent},{r.packets_received},"
-                    f"{r.packet_loss:.1f},{r.min_latency or ''},{r.avg_latency or ''},{r.max_latency or ''}\n")
-    
+    """Save results to a CSV file."""
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(
+            (r.host, r.is_reachable, r.packets_sent, r.packets_received,
+             f"{r.packet_loss:.1f}", r.min_latency or "", r.avg_latency or "", r.max_latency or "")
+            for r in results
+        )
+
     print(f"\n{Colors.GREEN}[+] Results saved to {output_path}{Colors.RESET}")
 
 
+def _iter_hosts(args: argparse.Namespace):
+    """Yield hosts from the command line, then the hosts file, lazily."""
+    yield from args.hosts
+    if args.file:
+        with open(args.file, "r") as f:
+            for line in f:
+                host = line.strip()
+                if host and not host.startswith("#"):
+                    yield host
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -329,7 +715,15 @@ Examples:
         "-T", "--threads",
         type=int,
         default=DEFAULT_THREADS,
-        help=f"Number of threads for batch pinging (default: {DEFAULT_THREADS})"
+        help=f"Number of threads for batch pinging (default: {DEFAULT_THREADS}, "
+             "auto-scaled up to 256 for larger host lists when not set)"
+    )
+    parser.add_argument(
+        "--tcp",
+        type=int,
+        metavar="PORT",
+        help="Probe reachability with a TCP connect to PORT instead of ICMP "
+             "(one RTT, no privileges; implies a single probe per host)"
     )
     parser.add_argument(
         "-o", "--output",
@@ -366,28 +760,26 @@ Examples:
     if not args.quiet:
         print_banner()
     
-    # Collect hosts
-    hosts = list(args.hosts) if args.hosts else []
-    
-    if args.file:
-        if not os.path.isfile(args.file):
-            print(f"{Colors.RED}[!] File not found: {args.file}{Colors.RESET}")
-            sys.exit(1)
-        
-        with open(args.file, "r") as f:
-            file_hosts = [line.strip() for line in f if line.strip() and not line.startswith("#")]
-            hosts.extend(file_hosts)
-    
+    if args.file and not os.path.isfile(args.file):
+        print(f"{Colors.RED}[!] File not found: {args.file}{Colors.RESET}")
+        sys.exit(1)
+
+    # Stream hosts from both sources, deduping (order-preserving) in one pass
+    hosts = list(dict.fromkeys(_iter_hosts(args)))
+
     if not hosts:
         parser.print_help()
         sys.exit(1)
-    
-    # Remove duplicates while preserving order
-    hosts = list(dict.fromkeys(hosts))
+
+    # Pinging is I/O-bound, so a fixed 10-thread pool throttles big scans.
+    # When the user left -T at its default, scale the pool with the host
+    # count (capped so tiny inputs never pay for idle threads).
+    if args.threads == DEFAULT_THREADS and len(hosts) > DEFAULT_THREADS:
+        args.threads = min(len(hosts), 256)
     
     # Ping hosts
     if len(hosts) == 1:
-        result = ping_host(hosts[0], args.count, args.timeout)
+        result = ping_host(hosts[0], args.count, args.timeout, port=args.tcp)
         print()
         print_result(result, args.verbose)
         results = [result]
@@ -397,7 +789,8 @@ Examples:
             count=args.count,
             timeout=args.timeout,
             threads=args.threads,
-            verbose=args.verbose
+            verbose=args.verbose,
+            port=args.tcp
         )
         print_summary(results)
     